@@ -5,9 +5,12 @@
 # breaks the compilation later on due to invalid version constraints, so we
 # are augmenting it with correct revision and link to the valid cabal file
 
+from base64 import b64encode
 from hashlib import sha256
+from multiprocessing.pool import ThreadPool
 from urllib.parse import urljoin
 import json
+import multiprocessing
 import os
 import requests
 import subprocess
@@ -32,18 +35,24 @@ pkg_len = len(pkgs)
 lock = {}
 
 
-def to_sri(h):
-    return subprocess.run(
-        ["nix", "hash", "to-sri", "--type", "sha256", h],
-        check=True,
-        capture_output=True,
-        text=True,
-    ).stdout.strip()
+NIX32_CHARS = "0123456789abcdfghijklmnpqrsvwxyz"
 
 
-for i, pkg in enumerate(pkgs):
+# Convert hashes to SRI in-process instead of spawning `nix hash to-sri`
+# for every single one of them.
+def to_sri(digest):
+    return f"sha256-{b64encode(digest).decode()}"
+
+
+def nix32_to_sri(h):
+    n = 0
+    for i, c in enumerate(reversed(h)):
+        n |= NIX32_CHARS.index(c) << (5 * i)
+    return to_sri(n.to_bytes(32, "little"))
+
+
+def resolve(i, pkg):
     name = pkg["pkg-name"]
-    id = pkg["id"]
     version = pkg["pkg-version"]
 
     print(f"[{i+1}/{pkg_len}] Resolving revision for {name}-{version}")
@@ -64,9 +73,9 @@ for i, pkg in enumerate(pkgs):
             f"https://hackage.haskell.org/package/{name}-{version}/revision/{no}.cabal"
         )
         rev_cabal = requests.get(rev_url).text
-        rev_hash = sha256(rev_cabal.encode("utf-8")).hexdigest()
+        rev_hash = sha256(rev_cabal.encode("utf-8"))
 
-        if rev_hash == pkg["pkg-cabal-sha256"]:
+        if rev_hash.hexdigest() == pkg["pkg-cabal-sha256"]:
             # Cabal gives hash before unpack, so we need to prefetch the source
             src_hash = subprocess.run(
                 ["nix-prefetch-url", "--unpack", "--type", "sha256", url],
@@ -74,24 +83,32 @@ for i, pkg in enumerate(pkgs):
                 capture_output=True,
                 text=True,
             ).stdout.strip()
-            src_hash = to_sri(src_hash)
+            src_hash = nix32_to_sri(src_hash)
 
-            lock[id] = {
+            return {
                 "name": name,
                 "version": version,
                 "cabal": {
                     "url": rev_url,
-                    "hash": to_sri(rev_hash),
+                    "hash": to_sri(rev_hash.digest()),
                 },
                 "src": {
                     "url": url,
                     "hash": src_hash,
                 },
             }
-            break
-    else:
-        print(f"Could not find revision for {name}-{version}")
+
+
+# Packages are independent of each other and resolving them is dominated by
+# network round trips, so resolve them concurrently.
+with ThreadPool(processes=multiprocessing.cpu_count() * 2) as pool:
+    entries = pool.starmap(resolve, enumerate(pkgs))
+
+for pkg, entry in zip(pkgs, entries):
+    if entry is None:
+        print(f"Could not find revision for {pkg['pkg-name']}-{pkg['pkg-version']}")
         sys.exit(1)
+    lock[pkg["id"]] = entry
 
 with open(os.environ.get("out"), "w") as f:
     json.dump(lock, f, indent=2)
@@ -15,7 +15,7 @@ closure = set(dependencies)
 
 
 def getDeps(deps):
-    for dep in deps.copy():
+    for dep in deps:
         if dep in checked:
             continue
         checked.add(dep)
@@ -36,8 +36,8 @@ def getSource(depName):
         ["git", "ls-remote", repo, version], text=True, capture_output=True
     ).stdout.split()[0]
     print(f"{repo}/{version}: {rev}")
-    lock[depName] = dep
-    lock[depName]["rev"] = rev
+    # don't mutate the entry shared with packagesSet
+    lock[depName] = {**dep, "rev": rev}
 
 
 with ThreadPool(processes=multiprocessing.cpu_count() * 2) as pool:
@@ -55,14 +55,16 @@
 
 
     def run_refresh_script(script):
-        with tempfile.NamedTemporaryFile() as out_file:
+        # let the script create $out itself inside a private directory,
+        # instead of keeping an unused handle to a file it may replace
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, "out")
             env = os.environ.copy()
-            env["out"] = out_file.name
+            env["out"] = out_path
             subprocess.run(
                 [script],
                 check=True, shell=True, env=env)
-            # open the file again via its name (it might have been replaced)
-            with open(out_file.name) as out:
+            with open(out_path) as out:
                 return json.load(out)
 
 
@@ -101,13 +103,16 @@
 
       out_path = os.getenv("out")
       drv_path = "${drvPath}"  # noqa: E501
+      fod_name = re.escape("${fod.name}")  # noqa: E501
+      hash_mismatch = re.compile(
+          rf"error: hash mismatch in fixed-output derivation '[^']*{fod_name}[^']*':"  # noqa: E501
+      )
       nix_build = ["${config.deps.nix}/bin/nix", "build", "-L", drv_path]  # noqa: E501
       with subprocess.Popen(nix_build, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as process:  # noqa: E501
           for line in process.stdout:
               line = line.strip()
               print(line)
-              search = r"error: hash mismatch in fixed-output derivation '.*${fod.name}.*':"  # noqa: E501
-              if re.match(search, line):
+              if hash_mismatch.match(line):
                   print("line matched")
                   specified = next(process.stdout).strip().split(" ", 1)
                   got = next(process.stdout).strip().split(" ", 1)
@@ -123,11 +128,12 @@
               print("Could not determine hash", file=sys.stdout)
               exit(1)
       # At this point the derivation was built successfully and we can just read
-      #   the hash from the drv file.
-      show_derivation = ["${config.deps.nix}/bin/nix", "derivation show", drv_path]  # noqa: E501
-      result = subprocess.run(show_derivation, stdout=subprocess.PIPE, text=True)
-      drv = json.loads(result.stdout)
-      checksum = drv[drv_path]["outputs"]["out"]["hash"]
+      #   the hash from the drv file. Parse it directly instead of spawning
+      #   another nix process, a FOD only has the single output "out".
+      with open(drv_path) as f:
+          drv = f.read()
+      out_hash = re.compile(r'Derive\(\[\("out","[^"]*","[^"]*","([0-9a-f]+)"\)')  # noqa: E501
+      checksum = out_hash.match(drv).group(1)
       checksum =\
           codecs.encode(codecs.decode(checksum, 'hex'), 'base64').decode().strip()
       checksum = f"sha256-{checksum}"
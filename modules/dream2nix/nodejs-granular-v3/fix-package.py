@@ -45,12 +45,10 @@ if version not in ["unknown", package_json.get("version")]:
 # as NPM install will otherwise re-fetch these
 if "dependencies" in package_json:
     dependencies = package_json["dependencies"]
+    bundled_dependencies = set(package_json.get("bundledDependencies", []))
     # dependencies can be a list or dict
     for pname in dependencies:
-        if (
-            "bundledDependencies" in package_json
-            and pname in package_json["bundledDependencies"]
-        ):
+        if pname in bundled_dependencies:
             continue
         if pname not in available_deps:
             print(
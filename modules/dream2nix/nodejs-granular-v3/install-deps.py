@@ -27,19 +27,16 @@ def get_package_json(path):
 
 
 def install_direct_dependencies():
-    if not os.path.isdir(root):
-        os.mkdir(root)
-    with open(os.environ.get("nodeDepsPath")) as f:
-        deps = f.read().split()
-    for dep in deps:
+    os.makedirs(root, exist_ok=True)
+    for dep in nodeDeps:
         if os.path.isdir(f"{dep}/lib/node_modules"):
             for module in os.listdir(f"{dep}/lib/node_modules"):
                 # ignore hidden directories
                 if module[0] == ".":
                     continue
                 if module[0] == "@":
+                    pathlib.Path(f"{root}/{module}").mkdir(exist_ok=True)
                     for submodule in os.listdir(f"{dep}/lib/node_modules/{module}"):
-                        pathlib.Path(f"{root}/{module}").mkdir(exist_ok=True)
                         print(f"installing: {module}/{submodule}")
                         origin = os.path.realpath(
                             f"{dep}/lib/node_modules/{module}/{submodule}"
@@ -56,20 +53,18 @@ def install_direct_dependencies():
 
 
 def collect_dependencies(root, depth):
-    if not os.path.isdir(root):
+    try:
+        entries = list(os.scandir(root))
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    dirs = os.listdir(root)
 
     currentDeps = []
-    for d in dirs:
-        if d.rpartition("/")[-1].startswith("@"):
-            subdirs = os.listdir(f"{root}/{d}")
-            for sd in subdirs:
-                cur_dir = f"{root}/{d}/{sd}"
-                currentDeps.append(f"{cur_dir}")
+    for entry in entries:
+        if entry.name.startswith("@"):
+            for sd in os.listdir(f"{root}/{entry.name}"):
+                currentDeps.append(f"{root}/{entry.name}/{sd}")
         else:
-            cur_dir = f"{root}/{d}"
-            currentDeps.append(cur_dir)
+            currentDeps.append(f"{root}/{entry.name}")
 
     if depth == 0:
         return currentDeps
@@ -8,6 +8,7 @@ For retrieving the release dates for files, it uses the pypi.org json api
 It has to do one extra api request for each queried package name
 """
 
+import functools
 import json
 import os
 import sys
@@ -20,6 +21,17 @@ import gzip
 from mitmproxy import http
 
 
+# The ca bundle is only written after the proxy started, so this can't happen
+# at import time, but there is no need to re-read it for every request.
+@functools.cache
+def get_ssl_context():
+    ca_file = Path(os.getenv("HOME")) / ".ca-cert.pem"
+    if not ca_file.exists():
+        print("mitmproxy ca not found")
+        sys.exit(1)
+    return ssl.create_default_context(cafile=ca_file)
+
+
 """
 Query the pypi json api to get timestamps for all release files of the given pname.
 return all file names which are newer than the given timestamp
@@ -27,19 +39,19 @@ return all file names which are newer than the given timestamp
 
 
 def get_files_to_hide(pname, max_ts):
-    ca_file = Path(os.getenv("HOME")) / ".ca-cert.pem"
-    context = ssl.create_default_context(cafile=ca_file)
-    if not ca_file.exists():
-        print("mitmproxy ca not found")
-        sys.exit(1)
-
     # query the api
     url = f"https://pypi.org/pypi/{pname}/json"
     req = Request(url)
     req.add_header("Accept-Encoding", "gzip")
-    with urlopen(req, context=context) as response:
-        content = gzip.decompress(response.read())
-        resp = json.loads(content)
+    # decompress from the response stream, so the compressed body isn't kept
+    # in memory as a separate copy next to the decompressed one.
+    with urlopen(req, context=get_ssl_context()) as response:
+        body = (
+            gzip.GzipFile(fileobj=response)
+            if response.headers.get("Content-Encoding") == "gzip"
+            else response
+        )
+        resp = json.load(body)
 
     # collect files to hide
     files = set()
@@ -90,12 +102,13 @@ def response(flow: http.HTTPFlow) -> None:
         return
     pname = flow.request.url.strip("/").split("/")[-1]
     badFiles = get_files_to_hide(pname, max_ts)
-    keepFile = lambda file: file["filename"] not in badFiles
-    data = json.loads(flow.response.text)
+    # only decode and re-encode the (potentially large) response body
+    # if there is actually something to remove from it
     if badFiles:
         print(f"removing the following files form the API response:\n  {badFiles}")
-        data["files"] = list(filter(keepFile, data["files"]))
-    flow.response.text = json.dumps(data)
+        data = json.loads(flow.response.text)
+        data["files"] = [f for f in data["files"] if f["filename"] not in badFiles]
+        flow.response.text = json.dumps(data)
     # prevent the modified response from ending up in the pip cache
     flow.response.headers["Vary"] = "*"
     # See this comment in cachecontrol/controller.py in pip:
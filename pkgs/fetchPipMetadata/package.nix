@@ -18,6 +18,7 @@
       certifi
       flit-core
       nix-prefetch-scripts
+      orjson
       python-dateutil
       pip
     ];
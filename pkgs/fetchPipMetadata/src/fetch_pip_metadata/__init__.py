@@ -7,6 +7,11 @@ import json
 import dateutil.parser
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .lock_file_from_report import lock_file_from_report
 from .pypi_proxy import PypiProxy
 
@@ -38,6 +43,25 @@ def prepare_venv(venv_path, pip_version, wheel_version, python_interpreter: Path
     return venv_path
 
 
+def load_json(path):
+    with open(path, "rb") as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
+def dump_json(data, path):
+    # both branches write the same bytes: orjson always emits utf-8,
+    # so the stdlib fallback must not escape non-ascii characters either.
+    if orjson is not None:
+        with open(path, "wb") as f:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+
 def fetch_pip_metadata():
     parser = argparse.ArgumentParser(description="Fetch metadata for python packages")
     # use argparse to parse arguments
@@ -119,9 +143,6 @@ def fetch_pip_metadata():
         )
         proxy.kill()
 
-        with open(home / "report.json", "r") as f:
-            report = json.load(f)
-
-        with open(os.getenv("out"), "w") as f:
-            lock = lock_file_from_report(report, project_root=args.project_root)
-            json.dump(lock, f, indent=2, sort_keys=True)
+        report = load_json(home / "report.json")
+        lock = lock_file_from_report(report, project_root=args.project_root)
+        dump_json(lock, os.getenv("out"))
@@ -112,8 +112,8 @@ def lock_info_from_archive(download_info) -> Optional[Tuple[str, Optional[str]]]
     except KeyError:
         return None
 
-    hash = archive_info.get("hash", "").split("=", 1)
-    sha256 = hash[1] if hash[0] == "sha256" else None
+    algo, _, digest = archive_info.get("hash", "").partition("=")
+    sha256 = digest if algo == "sha256" and digest else None
 
     return {"type": "url", "url": download_info["url"], "sha256": sha256}
 
@@ -182,9 +182,10 @@ def evaluate_requirements(env, reqs, dependencies, root_name, extras, seen):
     If so, add them to our lock files dependencies field and delete
     requirements to save space in the file.
     A circuit breaker is included to avoid infinite recursion in nix.
+    `seen` is the set of packages on the current path; it is shared across
+    the recursion and restored before returning instead of being copied.
     """
-    seen = seen.copy()
-    seen.append(root_name)
+    seen.add(root_name)
 
     if root_name not in dependencies:
         dependencies[root_name] = set()
@@ -197,6 +198,8 @@ def evaluate_requirements(env, reqs, dependencies, root_name, extras, seen):
                 evaluate_requirements(
                     env, reqs, dependencies, req_name, req.extras, seen
                 )  # noqa: 501
+
+    seen.discard(root_name)
     return dependencies
 
 
@@ -250,11 +253,11 @@ def lock_file_from_report(report, project_root: Path):
     # recursively iterate over the dependency tree from top to bottom
     # to evaluate optional requirements (extras) correctly
     for root_name, extras in roots.items():
-        for extra in set(extras).union(set(["default"])):
+        for extra in {*extras, "default"}:
             extras = [] if extra == "default" else [extra]
             dependencies = dict()
             evaluate_requirements(
-                env, requirements, dependencies, root_name, extras, list()
+                env, requirements, dependencies, root_name, extras, set()
             )
             if extra not in targets:
                 targets[extra] = dependencies
@@ -264,19 +267,17 @@ def lock_file_from_report(report, project_root: Path):
     # iterate over targets to deduplicate dependencies already in the default set
     # with the same indirect deps
     default_pkgs = targets["default"]
-    default_names = set(default_pkgs.keys())
     for extra, pkgs in targets.items():
         if extra == "default":
             continue
-        names = set(pkgs.keys())
-        for name in default_names.intersection(names):
-            if pkgs[name] == default_pkgs[name]:
-                del pkgs[name]
+        targets[extra] = {
+            name: deps for name, deps in pkgs.items() if default_pkgs.get(name) != deps
+        }
 
     return {
         "sources": packages,
         "targets": {
-            target: {pkg: sorted(list(deps)) for pkg, deps in pkgs.items()}
+            target: {pkg: sorted(deps) for pkg, deps in pkgs.items()}
             for target, pkgs in targets.items()
         },
     }
@@ -60,11 +60,11 @@ class PypiProxy:
             try:
                 res = urllib.request.urlopen(req, None, 5)
                 if res.status < 400:
-                    break
+                    return
             except urllib.error.URLError:
                 pass
-            finally:
-                time.sleep(1)
+            # only back off if the proxy isn't reachable yet
+            time.sleep(1)
 
     def generate_ca_bundle(self, path):
         """
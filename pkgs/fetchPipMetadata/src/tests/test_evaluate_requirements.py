@@ -14,7 +14,7 @@ def test_noop():
         dependencies=dict(),
         root_name="root_package",
         extras=None,
-        seen=[],
+        seen=set(),
     )
     assert result == dict(
         root_package={"requests"},
@@ -32,7 +32,7 @@ def test_extra_not_selected():
         dependencies=dict(),
         root_name="root_package",
         extras=None,
-        seen=[],
+        seen=set(),
     )
     assert result == dict(root_package=set())
 
@@ -47,7 +47,7 @@ def test_extra_selected():
         dependencies=dict(),
         root_name="root_package",
         extras=["http"],
-        seen=[],
+        seen=set(),
     )
     assert result == dict(
         root_package={"requests"},
@@ -65,7 +65,7 @@ def test_platform_mismatch():
         dependencies=dict(),
         root_name="root_package",
         extras=None,
-        seen=[],
+        seen=set(),
     )
     assert result == dict(root_package=set())
 
@@ -81,10 +81,32 @@ def test_cycle():
         dependencies=dict(),
         root_name="root_package",
         extras=None,
-        seen=[],
+        seen=set(),
     )
     assert result == dict(
         root_package={"foo"},
         foo={"bar"},
         bar=set(),
     )
+
+
+def test_cycle_seen_restored():
+    seen = set()
+    result = l.evaluate_requirements(
+        env={},
+        reqs=dict(
+            root_package={Requirement("foo"), Requirement("bar")},
+            foo={Requirement("bar")},
+            bar={Requirement("foo")},
+        ),
+        dependencies=dict(),
+        root_name="root_package",
+        extras=None,
+        seen=seen,
+    )
+    assert seen == set()
+    assert result == dict(
+        root_package={"foo", "bar"},
+        foo={"bar"},
+        bar={"foo"},
+    )
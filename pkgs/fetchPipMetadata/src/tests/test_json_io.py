@@ -0,0 +1,35 @@
+import pytest
+
+import fetch_pip_metadata as f
+
+LOCK = dict(
+    sources=dict(
+        test=dict(
+            type="url",
+            sha256=None,
+            url="https://example.com/é",
+            version="0.0.0",
+        )
+    ),
+    targets=dict(default=dict(test=[])),
+)
+
+
+@pytest.mark.skipif(f.orjson is None, reason="orjson not installed")
+def test_backends_write_same_bytes(tmp_path, monkeypatch):
+    f.dump_json(LOCK, tmp_path / "orjson.json")
+    monkeypatch.setattr(f, "orjson", None)
+    f.dump_json(LOCK, tmp_path / "stdlib.json")
+    orjson_bytes = (tmp_path / "orjson.json").read_bytes()
+    assert orjson_bytes == (tmp_path / "stdlib.json").read_bytes()
+    assert "é".encode() in orjson_bytes
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_roundtrip(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(f, "orjson", None)
+    elif f.orjson is None:
+        pytest.skip("orjson not installed")
+    f.dump_json(LOCK, tmp_path / "lock.json")
+    assert f.load_json(tmp_path / "lock.json") == LOCK
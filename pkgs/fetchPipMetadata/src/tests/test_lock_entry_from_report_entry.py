@@ -41,6 +41,46 @@ def test_url_with_hash():
     assert l.lock_entry_from_report_entry(install, Path("foo")) == expected
 
 
+def test_url_with_other_hash():
+    install = dict(
+        metadata=dict(
+            name="test",
+            version="0.0.0",
+        ),
+        download_info=dict(
+            url="https://example.com",
+            archive_info=dict(hash="md5=example_hash"),
+        ),
+    )
+    expected = "test", dict(
+        type="url",
+        url=install["download_info"]["url"],
+        version=install["metadata"]["version"],
+        sha256=None,
+    )
+    assert l.lock_entry_from_report_entry(install, Path("foo")) == expected
+
+
+def test_url_with_malformed_hash():
+    install = dict(
+        metadata=dict(
+            name="test",
+            version="0.0.0",
+        ),
+        download_info=dict(
+            url="https://example.com",
+            archive_info=dict(hash="sha256"),
+        ),
+    )
+    expected = "test", dict(
+        type="url",
+        url=install["download_info"]["url"],
+        version=install["metadata"]["version"],
+        sha256=None,
+    )
+    assert l.lock_entry_from_report_entry(install, Path("foo")) == expected
+
+
 def test_path_external():
     install = dict(
         metadata=dict(
@@ -98,3 +98,40 @@ def test_multiple_requested():
         ),
     )
     assert l.lock_file_from_report(report, Path("foo")) == expected
+
+
+def test_extra_deduplicated_against_default():
+    report = dict(
+        environment=dict(),
+        install=[
+            dict(
+                requested=True,
+                requested_extras=["http"],
+                metadata=dict(
+                    name="foo",
+                    version="0.0.0",
+                    requires_dist=["bar", "baz; extra == 'http'"],
+                ),
+                download_info=dict(url="https://example.com"),
+            ),
+            dict(
+                metadata=dict(name="bar", version="0.0.0"),
+                download_info=dict(url="https://example.com"),
+            ),
+            dict(
+                metadata=dict(name="baz", version="0.0.0"),
+                download_info=dict(url="https://example.com"),
+            ),
+        ],
+    )
+    targets = l.lock_file_from_report(report, Path("foo"))["targets"]
+    assert targets == dict(
+        default=dict(
+            foo=["bar"],
+            bar=[],
+        ),
+        http=dict(
+            foo=["bar", "baz"],
+            baz=[],
+        ),
+    )